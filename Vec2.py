@@ -1,15 +1,21 @@
 import math
 
+# Conversion factor, so converting an angle is a multiply instead of a function call
+_DEG2RAD = math.pi / 180.0
+
 class Vec2:
     '''
     Class used for 2 dimensional vectors (effectively just a set of 2d coordinates)
     Contains functions which allow it to be treated similar to a tuple but with attributes x and y for readability
     '''
 
+    # No per instance __dict__, which makes each object smaller and attribute access faster
+    __slots__ = ('x', 'y', '_mag')
+
     # Constructor
     def __init__(self, x: float, y: float):
         '''
-        Creates an object with a given (x, y) as well as a magnitude (length)
+        Creates an object with a given (x, y). The magnitude (length) is only calculated once it is needed
         '''
 
         try:
@@ -18,7 +24,8 @@ class Vec2:
         except ValueError:
             raise Exception(f"Cannot create Vec2 object with x = {x} ({type(x)}), and y={y} ({type(y)})")
 
-        self.magnitude = math.sqrt((self.x ** 2) + (self.y ** 2))
+        # Magnitude is computed lazily, see the magnitude property
+        self._mag = None
 
     # Built in function overrides
     def __repr__(self):
@@ -32,43 +39,41 @@ class Vec2:
         '''
         Allows sets to properly use Vec2 objects
         '''
-        return hash(self.__repr__())
+        return hash((self.x, self.y))
 
     def __eq__(self, other):
         '''
         Allows Vec2 objects to be compared ( using == ). If both x and y components are equal it will return True
         '''
-        try:
+        if self is other:
+            return True
+
+        if type(other) is Vec2:
             return (self.x == other.x) and (self.y == other.y)
-        except AttributeError:
-            # other must not be a Vec2 object
-            return False
+
+        # other is not a Vec2 object, so let python try other.__eq__ (and fall back to False)
+        return NotImplemented
 
     def __add__(self, other):
         '''
         (Vec2, Vec2) -> Vec2
         Allows Vec2 objects to perform vector addition
         '''
-        try:
-            x = self.x + other.x
-            y = self.y + other.y
-        except AttributeError:
-            raise Exception(f"Cannot add type {type(self)} and type {type(other)} (both should be type Vec2)")
-        
-        return Vec2(x, y)
+        # Returning NotImplemented lets python try other's reflected operator (or raise a TypeError)
+        if type(other) is not Vec2:
+            return NotImplemented
+
+        return Vec2(self.x + other.x, self.y + other.y)
 
     def __sub__(self, other):
         '''
         (Vec2, Vec2) -> Vec2
         Allows Vec2 objects to perform vector subtraction
         '''
-        try:
-            x = self.x - other.x
-            y = self.y - other.y
-        except AttributeError:
-            raise Exception(f"Cannot subtract type {type(self)} and type {type(other)} (both should be type Vec2)")
-        
-        return Vec2(x, y)
+        if type(other) is not Vec2:
+            return NotImplemented
+
+        return Vec2(self.x - other.x, self.y - other.y)
 
     def __mul__(self, other: float):
         '''
@@ -76,24 +81,34 @@ class Vec2:
         Overrides python multiplication to do the vector scale function
         '''
 
-        try:
-            factor = float(other)
-        except ValueError:
-            raise Exception(f"Cannot multiply Vec2 by {other} (type {type(other)}) (should be type int or float)")
+        # Skip the float() conversion when other is already a number
+        if type(other) is float or type(other) is int:
+            factor = other
+        else:
+            try:
+                factor = float(other)
+            except (ValueError, TypeError):
+                return NotImplemented
 
-        return self.copy().scale(factor)
+        return Vec2(self.x * factor, self.y * factor)
         
     def __truediv__(self, other: float):
         '''
         (Vec2, float) -> Vec2
         Overrides python division to do vector scaling by a factor of 1/other
         '''
-        try:
-            factor = 1 / float(other)
-        except ValueError:
-            raise Exception(f"Cannot divide Vec2 by {other} (type {type(other)}) (should be type int or float)")
-        
-        return self.copy().scale(factor)
+        if type(other) is float or type(other) is int:
+            factor = 1 / other
+        else:
+            try:
+                factor = 1 / float(other)
+            except (ValueError, TypeError):
+                return NotImplemented
+
+        return Vec2(self.x * factor, self.y * factor)
+
+    # Scaling is commutative, so 2 * v works the same as v * 2
+    __rmul__ = __mul__
 
     def __iter__(self):
         '''
@@ -109,18 +124,32 @@ class Vec2:
         '''
         return Vec2(self.x, self.y)
 
+    @property
+    def magnitude(self) -> float:
+        '''
+        The length of the vector. Only calculated the first time it is read, then cached until the vector is changed by scale or rotate
+        '''
+        if self._mag is None:
+            self._mag = math.hypot(self.x, self.y)
+        return self._mag
+
     def scale(self, factor: float):
         '''
         (Vec2, float) -> Vec2
         Scales the vector by a given factor
         '''
         try:
-            self.x *= float(factor)
-            self.y *= float(factor)
-            self.magnitude *= float(factor)
-        except ValueError:
+            factor = float(factor)
+        except (ValueError, TypeError):
             raise Exception(f"Cannot scale a Vec2 object by a factor of: {factor} ({type(factor)})")
-        
+
+        self.x *= factor
+        self.y *= factor
+
+        # Scaling multiplies the length by |factor|, so a cached magnitude can be kept without another sqrt
+        if self._mag is not None:
+            self._mag *= abs(factor)
+
         return self
 
     def normalise(self, magnitude: float = 1):
@@ -129,10 +158,18 @@ class Vec2:
         '''
 
         try:
-            self.scale( magnitude / self.magnitude )
-        except ValueError:
+            magnitude = float(magnitude)
+        except (ValueError, TypeError):
             raise Exception(f"Cannot normalise Vec2 to a magnitude of {magnitude} (type {type(magnitude)}) (should be type int or float)")
 
+        factor = magnitude / self.magnitude
+
+        self.x *= factor
+        self.y *= factor
+
+        # The new length is known exactly, so there is no need to work it out again
+        self._mag = abs(magnitude)
+
         return self
 
     def distance_to(self, other):
@@ -141,22 +178,22 @@ class Vec2:
         Returns the distance between one position and another
         '''
 
-        try:
-            return math.sqrt(((self.x - other.x) ** 2) + ((self.y - other.y) ** 2))
-        except AttributeError:
+        if type(other) is not Vec2:
             raise Exception(f"Cannot get distance between Vec2 type and {type(other)} type")
 
+        return math.hypot(self.x - other.x, self.y - other.y)
+
     def midpoint(self, other):
         '''
         Returns the midpoint between 2 vectors. Just averages out the 2 components
         '''
-        try:
-            return Vec2(
-                (self.x + other.x) / 2,
-                (self.y + other.y) / 2 
-            )
-        except AttributeError:
-            raise Exception(f"Cant find midpoint between Vec3 and type {type(other)}")
+        if type(other) is not Vec2:
+            raise Exception(f"Cant find midpoint between Vec2 and type {type(other)}")
+
+        return Vec2(
+            (self.x + other.x) / 2,
+            (self.y + other.y) / 2
+        )
 
     def in_bounds(self, bounds: tuple) -> bool:
         '''
@@ -178,11 +215,10 @@ class Vec2:
         if (low.x > high.x) or (low.y > high.y):
             raise Exception(f"Each coordinate of the low endpoint must be less than its high endpoint counterpart. low = {low} , high = {high}")
 
+        # Chained comparisons load each component once and stop at the first axis that is out of bounds
         return (
-            self.x > low.x and
-            self.y > low.y and
-            self.x < high.x and
-            self.y < high.y
+            low.x < self.x < high.x and
+            low.y < self.y < high.y
         )
 
     def dot_product(self, other) -> float:
@@ -191,7 +227,7 @@ class Vec2:
         Returns the dot product of the two vectors
         '''
 
-        if (type(other) != Vec2):
+        if type(other) is not Vec2:
             raise Exception(f"Cannot find dot product of Vec2 and {type(other)}")
 
         return (self.x * other.x) + (self.y * other.y)
@@ -209,22 +245,30 @@ class Vec2:
             if degrees == 0:
                 return self
 
-            # Make the around parameter be the origin if no argument was passed
+            # Rotate around the origin if no argument was passed
             if around is None:
-                around = Vec2(0, 0)
+                ax = ay = 0.0
+            else:
+                ax = around.x
+                ay = around.y
 
             # Relative (x, y) location to the "around" point
-            rel = Vec2(self.x - around.x, self.y - around.y)
+            rx = self.x - ax
+            ry = self.y - ay
 
             # Trig values
-            sin = math.sin(math.radians(degrees))
-            cos = math.cos(math.radians(degrees))
+            rad = degrees * _DEG2RAD
+            sin = math.sin(rad)
+            cos = math.cos(rad)
 
             # New components
-            self.x = (cos * rel.x) - (sin * rel.y) + around.x
-            self.y = (cos * rel.y) + (sin * rel.x) + around.y
+            self.x = (cos * rx) - (sin * ry) + ax
+            self.y = (cos * ry) + (sin * rx) + ay
+
+            # Rotating around a point other than the origin can change the length
+            self._mag = None
 
             return self
 
         except TypeError:
-            raise Exception(f"\n{self}.rotate2d(degrees = {degrees}, around = {around})\nInvalid Arguments")
+            raise Exception(f"\n{self}.rotate(degrees = {degrees}, around = {around})\nInvalid Arguments")
@@ -0,0 +1,99 @@
+import numpy as np
+
+from vectors_lib.Vec2 import Vec2
+
+class Vec2SoA:
+    '''
+    Minimal container for batches of 2 dimensional vectors, stored as a "structure of arrays" (x[:], y[:])
+    Only supports rotation for now, see rotate_many
+    A batch always owns its arrays. The constructor copies what it is given, so rotating a batch never changes the caller's arrays or another batch
+    '''
+
+    # Constructor
+    def __init__(self, x, y):
+        '''
+        Creates a batch of vectors from 2 equal length sequences of x and y components
+        The components are always copied into new arrays
+        '''
+
+        try:
+            self.x = np.array(x, dtype=np.float64)
+            self.y = np.array(y, dtype=np.float64)
+        except (ValueError, TypeError):
+            raise Exception(f"Cannot create Vec2SoA object with x = {x} ({type(x)}), and y = {y} ({type(y)})")
+
+        if self.x.shape != self.y.shape:
+            raise Exception(f"Cannot create Vec2SoA object from components of different shapes: {self.x.shape}, {self.y.shape}")
+
+    # Built in function overrides
+    def __repr__(self) -> str:
+        '''
+        Returns a string representing the Vec2SoA object
+        '''
+        return f"Vec2SoA(x={self.x}, y={self.y})"
+
+    def __len__(self) -> int:
+        '''
+        Returns the number of vectors in the batch
+        '''
+        return len(self.x)
+
+    def __getitem__(self, index):
+        '''
+        Returns the vector at a given index as a regular Vec2 object (holding copies of the components), for code that still expects the scalar api
+        Slices and masks return a new Vec2SoA, which also gets its own copy of the components
+        '''
+        if isinstance(index, (int, np.integer)):
+            return Vec2(self.x[index], self.y[index])
+
+        return Vec2SoA(self.x[index], self.y[index])
+
+    def __iter__(self):
+        '''
+        Yields each vector in the batch as a Vec2 object
+        '''
+        for i in range(len(self)):
+            yield Vec2(self.x[i], self.y[i])
+
+    # Instance functions
+    def copy(self):
+        '''
+        Returns a batch with the same components in new arrays
+        '''
+        return Vec2SoA(self.x, self.y)
+
+    def rotate(self, degrees, around = None):
+        '''
+        (Vec2SoA, float | array, Vec2) -> Vec2SoA
+        Rotates every vector in place some number of degrees about another point and returns the new self
+        degrees can be a single angle for the whole batch or an array with one angle per vector
+        COUNTER CLOCKWISE
+        '''
+        self.x, self.y = rotate_many(self.x, self.y, degrees, around)
+        return self
+
+def rotate_many(xs, ys, degrees, around = None):
+    '''
+    (array, array, float | array, Vec2) -> (array, array)
+    Rotates many points counter clockwise about another point, same as Vec2.rotate but over whole arrays of components
+    sin and cos are computed once per angle rather than once per point
+    '''
+
+    if around is None:
+        ax = ay = 0.0
+    else:
+        ax = around.x
+        ay = around.y
+
+    rad = np.deg2rad(degrees)
+    sin = np.sin(rad)
+    cos = np.cos(rad)
+
+    # Relative components to the "around" point
+    rx = np.subtract(xs, ax, dtype=np.float64)
+    ry = np.subtract(ys, ay, dtype=np.float64)
+
+    return (
+        (cos * rx) - (sin * ry) + ax,
+        (cos * ry) + (sin * rx) + ay
+    )
@@ -1,15 +1,28 @@
 import math
 
+# Conversion factors, so converting an angle is a multiply instead of a function call
+_DEG2RAD = math.pi / 180.0
+_RAD2DEG = 180.0 / math.pi
+
+# C extension built from _vecmath.pyx, see the README for how to build it
+try:
+    from vectors_lib import _vecmath
+except ImportError:
+    _vecmath = None
+
 class Vec3:
     '''
     Class used for 3 dimensional vectors or positions
     Contains functions which allow it to be treated similar to a tuple but with attributes x y z for readability
     '''
 
+    # No per instance __dict__, which makes each object smaller and attribute access faster
+    __slots__ = ('x', 'y', 'z', '_mag')
+
     # Constructor
     def __init__(self, x: float, y: float, z: float):
         '''
-        Creates an object with a given (x, y, z) as well as a magnitude (length)
+        Creates an object with a given (x, y, z). The magnitude (length) is only calculated once it is needed
         '''
 
         try:
@@ -19,7 +32,8 @@ class Vec3:
         except ValueError:
             raise Exception(f"Cannot create Vec3 object with x = {x} ({type(x)}), y = {y} ({type(y)}), and z = {z} ({type(z)})")
 
-        self.magnitude = math.sqrt((x ** 2) + (y ** 2) + (z ** 2))
+        # Magnitude is computed lazily, see the magnitude property
+        self._mag = None
 
     # Built in function overrides
     def __repr__(self) -> str:
@@ -33,44 +47,41 @@ class Vec3:
         '''
         Allows sets to properly use Vec3 objects
         '''
-        return hash(self.__repr__())
+        return hash((self.x, self.y, self.z))
 
     def __eq__(self, other):
         '''
         Allows Vec3 objects to be compared. If all x, y and z components are the same between the two vectors, it will return True
         '''
-        try:
+        if self is other:
+            return True
+
+        if type(other) is Vec3:
             return (self.x == other.x) and (self.y == other.y) and (self.z == other.z)
-        except AttributeError:
-            return False
+
+        # other is not a Vec3 object, so let python try other.__eq__ (and fall back to False)
+        return NotImplemented
 
     def __add__(self, other):
         '''
         (Vec3, Vec3) -> Vec3
         Allows Vec3 objects to perform vector addition
         '''
-        try:
-            x = self.x + other.x
-            y = self.y + other.y
-            z = self.z + other.z
-        except AttributeError:
-            raise Exception(f"Cannot add type {type(self)} and type {type(other)} (other should be type Vec3)")
-        
-        return Vec3(x, y, z)
+        # Returning NotImplemented lets python try other's reflected operator (or raise a TypeError)
+        if type(other) is not Vec3:
+            return NotImplemented
+
+        return Vec3(self.x + other.x, self.y + other.y, self.z + other.z)
 
     def __sub__(self, other):
         '''
         (Vec3, Vec3) -> Vec3
         Allows Vec3 objects to perform vector subtraction
         '''
-        try:
-            x = self.x - other.x
-            y = self.y - other.y
-            z = self.z - other.z
-        except AttributeError:
-            raise Exception(f"Cannot subtract type {type(self)} and type {type(other)} (other should be type Vec3)")
+        if type(other) is not Vec3:
+            return NotImplemented
 
-        return Vec3(x, y, z)
+        return Vec3(self.x - other.x, self.y - other.y, self.z - other.z)
 
     def __mul__(self, other):
         '''
@@ -78,24 +89,34 @@ class Vec3:
         Overrides python multiplication to do the vector scale function
         '''
 
-        try:
-            factor = float(other)
-        except ValueError:
-            raise Exception(f"Cannot multiply Vec3 by {other} (type {type(other)}) (should be type int or float)")
+        # Skip the float() conversion when other is already a number
+        if type(other) is float or type(other) is int:
+            factor = other
+        else:
+            try:
+                factor = float(other)
+            except (ValueError, TypeError):
+                return NotImplemented
 
-        return self.copy().scale(factor)
+        return Vec3(self.x * factor, self.y * factor, self.z * factor)
 
     def __truediv__(self, other: float):
         '''
         (Vec3, float) -> Vec3
         Overrides python division to do vector scale by 1/other
         '''
-        try:
-            factor = 1 / float(other)
-        except ValueError:
-            raise Exception(f"Cannot divide Vec3 by {other} (type {type(other)}) (should be type int or float)")
-        
-        return self.copy().scale(factor)
+        if type(other) is float or type(other) is int:
+            factor = 1 / other
+        else:
+            try:
+                factor = 1 / float(other)
+            except (ValueError, TypeError):
+                return NotImplemented
+
+        return Vec3(self.x * factor, self.y * factor, self.z * factor)
+
+    # Scaling is commutative, so 2 * v works the same as v * 2
+    __rmul__ = __mul__
 
     def __iter__(self):
         '''
@@ -112,6 +133,15 @@ class Vec3:
         '''
         return Vec3(self.x, self.y, self.z)
 
+    @property
+    def magnitude(self) -> float:
+        '''
+        The length of the vector. Only calculated the first time it is read, then cached until the vector is changed by scale or rotate
+        '''
+        if self._mag is None:
+            self._mag = math.hypot(self.x, self.y, self.z)
+        return self._mag
+
     def scale(self, factor: float):
         '''
         (Vec3, float) -> Vec3
@@ -119,13 +149,17 @@ class Vec3:
         '''
 
         try:
-            self.x *= float(factor)
-            self.y *= float(factor)
-            self.z *= float(factor)
-        except ValueError:
+            factor = float(factor)
+        except (ValueError, TypeError):
             raise Exception(f"Cannot scale Vec3 by factor of {factor} (type {type(factor)}) (should be type int or float)")
-        
-        self.magnitude = math.sqrt((self.x ** 2) + (self.y ** 2) + (self.z ** 2))
+
+        self.x *= factor
+        self.y *= factor
+        self.z *= factor
+
+        # Scaling multiplies the length by |factor|, so a cached magnitude can be kept without another sqrt
+        if self._mag is not None:
+            self._mag *= abs(factor)
 
         return self
 
@@ -135,10 +169,19 @@ class Vec3:
         '''
 
         try:
-            self.scale( magnitude / self.magnitude )
-        except ValueError:
+            magnitude = float(magnitude)
+        except (ValueError, TypeError):
             raise Exception(f"Cannot normalise Vec3 to a magnitude of {magnitude} (type {type(magnitude)}) (should be type int or float)")
 
+        factor = magnitude / self.magnitude
+
+        self.x *= factor
+        self.y *= factor
+        self.z *= factor
+
+        # The new length is known exactly, so there is no need to work it out again
+        self._mag = abs(magnitude)
+
         return self
 
     def distance_to(self, other):
@@ -146,23 +189,24 @@ class Vec3:
         Returns the distance between one position and another as a Vec3 object
         '''
         
-        try:
-            return math.sqrt(((self.x - other.x) ** 2) + ((self.y - other.y) ** 2) + ((self.z - other.z) ** 2))
-        except AttributeError:
+        if type(other) is not Vec3:
             raise Exception(f"Cannot get distance when between Vec3 and type {type(other)} (should be Vec3)")
 
+        return math.hypot(self.x - other.x, self.y - other.y, self.z - other.z)
+
     def midpoint(self, other):
         '''
         Returns the midpoint between 2 vectors. Just averages out the 3 components
         '''
-        try:
-            x = (self.x + other.x) / 2
-            y = (self.y + other.y) / 2
-            z = (self.z + other.z) / 2
-            return Vec3(x, y, z)
-        except AttributeError:
+        if type(other) is not Vec3:
             raise Exception(f"Cant find midpoint between Vec3 and type {type(other)} (should be Vec3)")
 
+        return Vec3(
+            (self.x + other.x) / 2,
+            (self.y + other.y) / 2,
+            (self.z + other.z) / 2
+        )
+
     def in_bounds(self, bounds: tuple) -> bool:
         '''
         (Vec3, (Vec3, Vec3)) -> bool
@@ -183,13 +227,11 @@ class Vec3:
         if (low.x > high.x) or (low.y > high.y) or (low.z > high.z):
             raise Exception(f"Each coordinate of the low endpoint must be less than its high endpoint counterpart. low = {low} , high = {high}")
 
+        # Chained comparisons load each component once and stop at the first axis that is out of bounds
         return (
-            self.x > low.x and
-            self.y > low.y and
-            self.z > low.z and
-            self.x < high.x and
-            self.y < high.y and
-            self.z < high.z
+            low.x < self.x < high.x and
+            low.y < self.y < high.y and
+            low.z < self.z < high.z
         )
 
     def dot_product(self, other) -> float:
@@ -198,95 +240,176 @@ class Vec3:
         Returns the dot product of two vectors
         '''
 
-        try:
-            return (self.x * other.x) + (self.y * other.y) + (self.z * other.z)
-        except AttributeError:
+        if type(other) is not Vec3:
             raise Exception(f"Cannot find dot product of Vec3 and type {type(other)} (should be Vec3)")
+
+        return (self.x * other.x) + (self.y * other.y) + (self.z * other.z)
     
     def cross_product(self, other):
         '''
         (Vec3, Vec3) -> Vec3
         Returns the cross product of self and other which will be a vector perpendicular to the given ones
         '''
-        
-        try:
-            x = (self.y * other.z) - (self.z * other.y)
-            y = (self.z * other.x) - (self.x * other.z)
-            z = (self.x * other.y) - (self.y * other.x)
-            return Vec3(x, y, z)
-        except AttributeError:
+
+        if type(other) is not Vec3:
             raise Exception(f"Cannot find cross product of Vec3 and {type(other)} (should be Vec3)")
 
+        return Vec3(
+            (self.y * other.z) - (self.z * other.y),
+            (self.z * other.x) - (self.x * other.z),
+            (self.x * other.y) - (self.y * other.x)
+        )
+
     def angle_to(self, other) -> float:
         '''
         (Vec3, Vec3) -> float
         Returns the angle between 2 vectors in 3d space (along the plane they share)
         '''
-    
-        try:
-            return math.degrees(math.acos((self.dot_product(other)) / (self.magnitude * other.magnitude)))
-        
-        # Other is not type Vec3
-        except AttributeError:
-            raise Exception(f"Cannot find dot product of Vec3 and {type(other)}")
-        
-        # Out of bounds of acos function. (This happens when both magnitudes are the same but floating points errors make the ratio slightly higher than 1)
-        except ValueError:
-            return 180
- 
-        # if one or both of the vectors is (0, 0, 0)
-        except ZeroDivisionError:
-            print("divided by zero") # this shouldnt happen so i want to see if it does
-            return 0
+
+        if type(other) is not Vec3:
+            raise Exception(f"Cannot find angle between Vec3 and {type(other)}")
+
+        # atan2(|a x b|, a . b) is accurate near 0 and 180 degrees, where acos of the ratio of magnitudes is not
+        # It never leaves its domain and needs no magnitudes, and if either vector is (0, 0, 0) it just returns 0
+        ax = self.x
+        ay = self.y
+        az = self.z
+        bx = other.x
+        by = other.y
+        bz = other.z
+
+        return math.atan2(
+            math.hypot((ay * bz) - (az * by), (az * bx) - (ax * bz), (ax * by) - (ay * bx)),
+            (ax * bx) + (ay * by) + (az * bz)
+        ) * _RAD2DEG
 
     def rotate(self, yaw: float = 0, pitch: float = 0, roll: float = 0, around = None):
         '''
-        (Vec3, float, float, Vec3) -> Vec3
-        Rotates self by a yaw and pitch around some point and returns the new location
+        (Vec3, float, float, float, Vec3) -> Vec3
+        Rotates self by a yaw, pitch and roll (applied in that order) around some point and returns the new location
         '''
 
         # This function re-uses code from vec2.rotate(), but i wanted Vec2 and Vec3 to be independent from each other so i rewrote it
 
-        if around is None:
-            around = Vec3(0, 0, 0)
+        try:
 
-        # relative position
-        rel = Vec3(self.x - around.x, self.y - around.y, self.z - around.z)
+            # Number of planes the point actually gets rotated in
+            # (counted with ints, since adding numpy bools is a logical or rather than a sum)
+            axes = int(yaw != 0) + int(pitch != 0) + int(roll != 0)
 
-        try:
+            if axes == 0:
+                return self
 
-            if yaw != 0:
+            if around is None:
+                ax = ay = az = 0.0
+            else:
+                ax = around.x
+                ay = around.y
+                az = around.z
 
-                # Trig values
-                sin = math.sin(math.radians(yaw))
-                cos = math.cos(math.radians(yaw))
+            # Relative position to the "around" point
+            rx = self.x - ax
+            ry = self.y - ay
+            rz = self.z - az
 
-                # New components
-                self.x = (cos * rel.x) - (sin * rel.z) + around.x
-                self.z = (cos * rel.z) + (sin * rel.x) + around.z
+            # Only one plane to rotate in, so skip building the full matrix
+            if axes == 1:
 
-            # If pitch is not 0, rotate point along the plane shared between the vector and the y axis
-            if pitch != 0:
+                if yaw != 0:
+                    rad = yaw * _DEG2RAD
+                    sin = math.sin(rad)
+                    cos = math.cos(rad)
 
-                # Trig values
-                sin = math.sin(math.radians(pitch))
-                cos = math.cos(math.radians(pitch))
+                    self.x = (cos * rx) - (sin * rz) + ax
+                    self.z = (cos * rz) + (sin * rx) + az
 
-                # New components
-                self.y = (cos * rel.y) - (sin * rel.z) + around.y
-                self.z = (cos * rel.z) + (sin * rel.y) + around.z
+                # Rotate point along the plane shared between the vector and the y axis
+                elif pitch != 0:
+                    rad = pitch * _DEG2RAD
+                    sin = math.sin(rad)
+                    cos = math.cos(rad)
+
+                    self.y = (cos * ry) - (sin * rz) + ay
+                    self.z = (cos * rz) + (sin * ry) + az
+
+                else:
+                    rad = roll * _DEG2RAD
+                    sin = math.sin(rad)
+                    cos = math.cos(rad)
+
+                    self.x = (cos * rx) - (sin * ry) + ax
+                    self.y = (cos * ry) + (sin * rx) + ay
 
-            if roll != 0:
+            else:
 
-                # Trig values
-                sin = math.sin(math.radians(roll))
-                cos = math.cos(math.radians(roll))
+                # Trig values for each angle (an angle of 0 just gives sin = 0 and cos = 1)
+                rad = yaw * _DEG2RAD
+                sy = math.sin(rad)
+                cy = math.cos(rad)
+
+                rad = pitch * _DEG2RAD
+                sp = math.sin(rad)
+                cp = math.cos(rad)
+
+                rad = roll * _DEG2RAD
+                sr = math.sin(rad)
+                cr = math.cos(rad)
+
+                # The yaw, pitch and roll rotations multiplied into one matrix (roll * pitch * yaw), so the point only gets transformed once
+                m00 = (cr * cy) + (sr * sp * sy)
+                m01 = -sr * cp
+                m02 = (sr * sp * cy) - (cr * sy)
+
+                m10 = (sr * cy) - (cr * sp * sy)
+                m11 = cr * cp
+                m12 = -(sr * sy) - (cr * sp * cy)
+
+                m20 = cp * sy
+                m21 = sp
+                m22 = cp * cy
 
                 # New components
-                self.x = (cos * rel.x) - (sin * rel.y) + around.x
-                self.y = (cos * rel.y) + (sin * rel.x) + around.y
+                self.x = (m00 * rx) + (m01 * ry) + (m02 * rz) + ax
+                self.y = (m10 * rx) + (m11 * ry) + (m12 * rz) + ay
+                self.z = (m20 * rx) + (m21 * ry) + (m22 * rz) + az
+
+            # Rotating around a point other than the origin can change the length
+            self._mag = None
 
             return self
 
         except TypeError:
-            raise Exception(f"\n{self}.rotate2d(yaw = {yaw}, pitch = {pitch}, around = {around})\nInvalid Arguments")
+            raise Exception(f"\n{self}.rotate(yaw = {yaw}, pitch = {pitch}, roll = {roll}, around = {around})\nInvalid Arguments")
+
+# When the C extension has been built, these replace the python versions of the methods above
+# Without it the math stays inline in the methods, so there is no extra function call on the normal path
+# (numba compiled versions for use inside your own @njit code are in jit_kernels.py)
+if _vecmath is not None:
+
+    def _dot_product(self, other) -> float:
+        if type(other) is not Vec3:
+            raise Exception(f"Cannot find dot product of Vec3 and type {type(other)} (should be Vec3)")
+
+        return _vecmath.dot3(self.x, self.y, self.z, other.x, other.y, other.z)
+
+    def _cross_product(self, other):
+        if type(other) is not Vec3:
+            raise Exception(f"Cannot find cross product of Vec3 and {type(other)} (should be Vec3)")
+
+        x, y, z = _vecmath.cross3(self.x, self.y, self.z, other.x, other.y, other.z)
+        return Vec3(x, y, z)
+
+    def _distance_to(self, other):
+        if type(other) is not Vec3:
+            raise Exception(f"Cannot get distance when between Vec3 and type {type(other)} (should be Vec3)")
+
+        return _vecmath.dist3(self.x, self.y, self.z, other.x, other.y, other.z)
+
+    # Keep the docstrings of the python versions
+    _dot_product.__doc__ = Vec3.dot_product.__doc__
+    _cross_product.__doc__ = Vec3.cross_product.__doc__
+    _distance_to.__doc__ = Vec3.distance_to.__doc__
+
+    Vec3.dot_product = _dot_product
+    Vec3.cross_product = _cross_product
+    Vec3.distance_to = _distance_to
@@ -0,0 +1,366 @@
+import numpy as np
+
+from vectors_lib.Vec3 import Vec3
+
+class Vec3SoA:
+    '''
+    Class used for batches of 3 dimensional vectors, stored as a "structure of arrays"
+    Each component is kept in its own contiguous numpy array (x[:], y[:], z[:]) so every operation runs as one numpy expression over the whole batch
+    Use this instead of looping over many Vec3 objects in python
+    A batch always owns its arrays. The constructor copies what it is given, so changing a batch in place (scale, normalise, rotate) never changes the caller's arrays or another batch
+    '''
+
+    # Constructor
+    def __init__(self, x, y, z):
+        '''
+        Creates a batch of vectors from 3 equal length sequences of x, y and z components
+        The components are always copied into new arrays
+        '''
+
+        try:
+            self.x = np.array(x, dtype=np.float64)
+            self.y = np.array(y, dtype=np.float64)
+            self.z = np.array(z, dtype=np.float64)
+        except (ValueError, TypeError):
+            raise Exception(f"Cannot create Vec3SoA object with x = {x} ({type(x)}), y = {y} ({type(y)}), and z = {z} ({type(z)})")
+
+        if not (self.x.shape == self.y.shape == self.z.shape):
+            raise Exception(f"Cannot create Vec3SoA object from components of different shapes: {self.x.shape}, {self.y.shape}, {self.z.shape}")
+
+    @classmethod
+    def from_vectors(cls, vectors):
+        '''
+        ([Vec3]) -> Vec3SoA
+        Packs a sequence of Vec3 objects into a single batch
+        '''
+        return cls(
+            [v.x for v in vectors],
+            [v.y for v in vectors],
+            [v.z for v in vectors]
+        )
+
+    # Built in function overrides
+    def __repr__(self) -> str:
+        '''
+        Returns a string representing the Vec3SoA object
+        '''
+        return f"Vec3SoA(x={self.x}, y={self.y}, z={self.z})"
+
+    def __len__(self) -> int:
+        '''
+        Returns the number of vectors in the batch
+        '''
+        return len(self.x)
+
+    def __getitem__(self, index):
+        '''
+        Returns the vector at a given index as a regular Vec3 object, for code that still expects the scalar api
+        The Vec3 holds copies of the components (it stores plain floats, so it can't be a view into the arrays)
+        Slices and masks return a new Vec3SoA, which also gets its own copy of the components
+        '''
+        if isinstance(index, (int, np.integer)):
+            return Vec3(self.x[index], self.y[index], self.z[index])
+
+        return Vec3SoA(self.x[index], self.y[index], self.z[index])
+
+    def __iter__(self):
+        '''
+        Yields each vector in the batch as a Vec3 object
+        '''
+        for i in range(len(self)):
+            yield Vec3(self.x[i], self.y[i], self.z[i])
+
+    # Instance functions
+    def copy(self):
+        '''
+        Returns a batch with the same components in new arrays
+        '''
+        return Vec3SoA(self.x, self.y, self.z)
+
+    @property
+    def magnitude(self):
+        '''
+        Returns an array of the magnitude (length) of every vector in the batch
+        '''
+        return np.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+    def add(self, other):
+        '''
+        (Vec3SoA, Vec3SoA | Vec3) -> Vec3SoA
+        Vector addition. A single Vec3 gets added to every vector in the batch
+        '''
+        ox, oy, oz = _components(other)
+        return _wrap(self.x + ox, self.y + oy, self.z + oz)
+
+    def sub(self, other):
+        '''
+        (Vec3SoA, Vec3SoA | Vec3) -> Vec3SoA
+        Vector subtraction. A single Vec3 gets subtracted from every vector in the batch
+        '''
+        ox, oy, oz = _components(other)
+        return _wrap(self.x - ox, self.y - oy, self.z - oz)
+
+    def scale(self, factor):
+        '''
+        (Vec3SoA, float | array) -> Vec3SoA
+        Scales every vector in place by a given factor, or by one factor per vector if given an array
+        '''
+
+        try:
+            factor = np.asarray(factor, dtype=np.float64)
+        except (ValueError, TypeError):
+            raise Exception(f"Cannot scale Vec3SoA by factor of {factor} (type {type(factor)}) (should be a number or array of numbers)")
+
+        self.x *= factor
+        self.y *= factor
+        self.z *= factor
+
+        return self
+
+    def normalise(self, magnitude: float = 1):
+        '''
+        Changes the magnitude of every vector in the batch while keeping the porportions of each component
+        '''
+        return self.scale(magnitude / self.magnitude)
+
+    def dot(self, other):
+        '''
+        (Vec3SoA, Vec3SoA | Vec3) -> array
+        Returns an array of the dot products of each pair of vectors
+        '''
+        ox, oy, oz = _components(other)
+        return self.x * ox + self.y * oy + self.z * oz
+
+    def cross(self, other):
+        '''
+        (Vec3SoA, Vec3SoA | Vec3) -> Vec3SoA
+        Returns the cross product of each pair of vectors
+        '''
+        ox, oy, oz = _components(other)
+        return _wrap(
+            self.y * oz - self.z * oy,
+            self.z * ox - self.x * oz,
+            self.x * oy - self.y * ox
+        )
+
+    def distance_to(self, other):
+        '''
+        (Vec3SoA, Vec3SoA | Vec3) -> array
+        Returns an array of the distances between each pair of positions
+        '''
+        ox, oy, oz = _components(other)
+        dx = self.x - ox
+        dy = self.y - oy
+        dz = self.z - oz
+        return np.sqrt(dx * dx + dy * dy + dz * dz)
+
+    def in_bounds(self, bounds: tuple):
+        '''
+        (Vec3SoA, (Vec3, Vec3)) -> array
+        Bounds is given as a tuple of 2 points serving as a min and then max respectively
+        Returns a boolean mask which is True for each point that lies within the bounding box specified
+        '''
+
+        if (len(bounds) != 2):
+            raise Exception(f"the list 'bounds' is not of length 2: bounds = {bounds}")
+
+        low = bounds[0]
+        high = bounds[1]
+
+        if (type(low) != Vec3) or (type(high) != Vec3):
+            raise Exception(f"({low} - {high}) is not a valid set of bounds (both endpoints must be Vec3 objects)")
+
+        if (low.x > high.x) or (low.y > high.y) or (low.z > high.z):
+            raise Exception(f"Each coordinate of the low endpoint must be less than its high endpoint counterpart. low = {low} , high = {high}")
+
+        # Build the mask in place so there is only one temporary array per comparison
+        mask = self.x > low.x
+        mask &= self.x < high.x
+        mask &= self.y > low.y
+        mask &= self.y < high.y
+        mask &= self.z > low.z
+        mask &= self.z < high.z
+
+        return mask
+
+    def rotate(self, yaw: float = 0, pitch: float = 0, roll: float = 0, around = None):
+        '''
+        (Vec3SoA, float | array, float | array, float | array, Vec3) -> Vec3SoA
+        Rotates every vector in place by a yaw, pitch and roll (applied in that order) around some point and returns the new self
+        Each angle can be a single angle for the whole batch or an array with one angle per vector
+        '''
+
+        if around is None:
+            ax = ay = az = 0.0
+        else:
+            ax = around.x
+            ay = around.y
+            az = around.z
+
+        # The three rotations are fused into one matrix so the points only get transformed once
+        matrix = rotation_matrix(yaw, pitch, roll)
+
+        rel = np.stack((self.x - ax, self.y - ay, self.z - az))
+
+        # With per vector angles the matrix has shape (3, 3, N), otherwise (3, 3) is shared by every vector
+        new = np.einsum('ij...,j...->i...', matrix, rel)
+
+        self.x = new[0] + ax
+        self.y = new[1] + ay
+        self.z = new[2] + az
+
+        return self
+
+def rotation_matrix(yaw = 0, pitch = 0, roll = 0):
+    '''
+    (float | array, float | array, float | array) -> array
+    Returns the 3x3 matrix that applies a yaw (x/z plane), then pitch (y/z plane), then roll (x/y plane), all in degrees
+    If any angle is an array of N angles, returns N matrices stacked along the last axis, with shape (3, 3, N)
+    '''
+
+    # Broadcast the angles together so the matrix entries all have the same shape
+    yaw, pitch, roll = np.broadcast_arrays(
+        np.deg2rad(yaw),
+        np.deg2rad(pitch),
+        np.deg2rad(roll)
+    )
+
+    sy, cy = np.sin(yaw), np.cos(yaw)
+    sp, cp = np.sin(pitch), np.cos(pitch)
+    sr, cr = np.sin(roll), np.cos(roll)
+
+    zero = np.zeros_like(sy)
+    one = np.ones_like(sy)
+
+    yaw_matrix = np.array((
+        (cy,   zero, -sy ),
+        (zero, one,  zero),
+        (sy,   zero, cy  )
+    ))
+
+    pitch_matrix = np.array((
+        (one,  zero, zero),
+        (zero, cp,   -sp ),
+        (zero, sp,   cp  )
+    ))
+
+    roll_matrix = np.array((
+        (cr,   -sr,  zero),
+        (sr,   cr,   zero),
+        (zero, zero, one )
+    ))
+
+    # Matrix products over the first two axes, done separately for each angle along any trailing axis
+    return np.einsum('ij...,jk...->ik...', roll_matrix, np.einsum('ij...,jk...->ik...', pitch_matrix, yaw_matrix))
+
+def cross_many(a, b, as_columns: bool = False):
+    '''
+    (array | tuple, array | tuple, bool) -> array | tuple
+    Returns the cross product of each pair of vectors in a and b
+    Each of a and b can be an (N, 3) array, a tuple of 3 component arrays (x, y, z), or a Vec3SoA
+    The result is an (N, 3) array, or a tuple of 3 component arrays if as_columns is True
+    '''
+
+    ax, ay, az = _columns(a)
+    bx, by, bz = _columns(b)
+
+    # Written out per component rather than using np.cross, which has reshaping overhead for a last axis this small
+    cx = ay * bz - az * by
+    cy = az * bx - ax * bz
+    cz = ax * by - ay * bx
+
+    if as_columns:
+        return cx, cy, cz
+
+    return np.stack((cx, cy, cz), axis=1)
+
+def squared_distance_to_many(point, others):
+    '''
+    (Vec3, array | tuple) -> array
+    Returns the squared distance from one point to many positions
+    others can be an (N, 3) array, a tuple of 3 component arrays (x, y, z), or a Vec3SoA
+    Use this over distance_to_many when only comparing distances, since it skips the sqrt
+    '''
+
+    if type(point) is not Vec3:
+        raise Exception(f"Cannot get distances from type {type(point)} (should be Vec3)")
+
+    ox, oy, oz = _columns(others)
+
+    dx = ox - point.x
+    dy = oy - point.y
+    dz = oz - point.z
+
+    return (dx * dx) + (dy * dy) + (dz * dz)
+
+def distance_to_many(point, others):
+    '''
+    (Vec3, array | tuple) -> array
+    Returns the distance from one point to many positions
+    others can be an (N, 3) array, a tuple of 3 component arrays (x, y, z), or a Vec3SoA
+    '''
+    return np.sqrt(squared_distance_to_many(point, others))
+
+def nearest(point, others, k: int):
+    '''
+    (Vec3, array | tuple, int) -> array
+    Returns the indices of the k positions in others closest to point, closest first
+    others can be an (N, 3) array, a tuple of 3 component arrays (x, y, z), or a Vec3SoA
+    '''
+
+    if k < 0:
+        raise Exception(f"Cannot find the {k} nearest positions (k should not be negative)")
+
+    squared = squared_distance_to_many(point, others)
+
+    if k >= len(squared):
+        return np.argsort(squared)
+
+    # Partitioning only finds the k smallest, so just those k need to be sorted afterwards
+    closest = np.argpartition(squared, k)[:k]
+    return closest[np.argsort(squared[closest])]
+
+def _columns(vectors):
+    '''
+    Returns the x, y and z component arrays of an (N, 3) array, a tuple of 3 component arrays, or a Vec3SoA
+    '''
+
+    if type(vectors) is Vec3SoA:
+        return vectors.x, vectors.y, vectors.z
+
+    if type(vectors) is tuple:
+        if len(vectors) != 3:
+            raise Exception(f"A tuple of components should have 3 arrays (x, y, z), not {len(vectors)}")
+
+        return (
+            np.asarray(vectors[0], dtype=np.float64),
+            np.asarray(vectors[1], dtype=np.float64),
+            np.asarray(vectors[2], dtype=np.float64)
+        )
+
+    points = np.asarray(vectors, dtype=np.float64)
+
+    if points.ndim != 2 or points.shape[1] != 3:
+        raise Exception(f"Vectors should be an array of shape (N, 3), not {points.shape}")
+
+    return points[:, 0], points[:, 1], points[:, 2]
+
+def _wrap(x, y, z):
+    '''
+    Returns a Vec3SoA built directly from 3 new float64 arrays, skipping the copy the constructor makes
+    Only use this with arrays nothing else holds a reference to
+    '''
+    batch = Vec3SoA.__new__(Vec3SoA)
+    batch.x = x
+    batch.y = y
+    batch.z = z
+    return batch
+
+def _components(other):
+    '''
+    Returns the (x, y, z) components of a Vec3SoA or Vec3 so either can be used as the other operand
+    '''
+    if type(other) is Vec3SoA or type(other) is Vec3:
+        return other.x, other.y, other.z
+
+    raise Exception(f"Cannot operate on Vec3SoA and type {type(other)} (should be Vec3SoA or Vec3)")
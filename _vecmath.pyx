@@ -0,0 +1,42 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+# distutils: extra_compile_args = -O3 -march=native -ffast-math
+
+# Optional C versions of the Vec3 math kernels
+# Vec3 uses these when this module has been built, and falls back to python otherwise
+# Build in place with:  cythonize -i _vecmath.pyx  (see the README, including what -ffast-math changes)
+
+from libc.math cimport sqrt
+
+cdef inline double _dot3(double ax, double ay, double az, double bx, double by, double bz) nogil:
+    return (ax * bx) + (ay * by) + (az * bz)
+
+cdef inline void _cross3(double ax, double ay, double az, double bx, double by, double bz, double* out) nogil:
+    out[0] = (ay * bz) - (az * by)
+    out[1] = (az * bx) - (ax * bz)
+    out[2] = (ax * by) - (ay * bx)
+
+cdef inline double _dist3(double ax, double ay, double az, double bx, double by, double bz) nogil:
+    cdef double dx = ax - bx
+    cdef double dy = ay - by
+    cdef double dz = az - bz
+    return sqrt((dx * dx) + (dy * dy) + (dz * dz))
+
+cpdef double dot3(double ax, double ay, double az, double bx, double by, double bz):
+    '''
+    Returns the dot product of (ax, ay, az) and (bx, by, bz)
+    '''
+    return _dot3(ax, ay, az, bx, by, bz)
+
+cpdef tuple cross3(double ax, double ay, double az, double bx, double by, double bz):
+    '''
+    Returns the cross product of (ax, ay, az) and (bx, by, bz) as a tuple of 3 floats
+    '''
+    cdef double out[3]
+    _cross3(ax, ay, az, bx, by, bz, out)
+    return (out[0], out[1], out[2])
+
+cpdef double dist3(double ax, double ay, double az, double bx, double by, double bz):
+    '''
+    Returns the distance between the positions (ax, ay, az) and (bx, by, bz)
+    '''
+    return _dist3(ax, ay, az, bx, by, bz)
@@ -0,0 +1,36 @@
+import math
+
+from numba import njit
+
+# Numba compiled versions of the Vec3 math kernels, for calling from your own @njit functions
+# Vec3 itself doesn't use these: calling a compiled function from plain python costs about as much as the few multiplies it saves
+# Requires numba. cache=True writes the compiled code to disk so the compile time (which can be seconds) is only paid once
+# fastmath=True lets the compiler assume there are no NaN or inf values, so results for those inputs are not guaranteed
+
+@njit(cache=True, fastmath=True)
+def dot3(ax: float, ay: float, az: float, bx: float, by: float, bz: float) -> float:
+    '''
+    Returns the dot product of (ax, ay, az) and (bx, by, bz)
+    '''
+    return (ax * bx) + (ay * by) + (az * bz)
+
+@njit(cache=True, fastmath=True)
+def cross3(ax: float, ay: float, az: float, bx: float, by: float, bz: float) -> tuple:
+    '''
+    Returns the cross product of (ax, ay, az) and (bx, by, bz) as a tuple of 3 floats
+    '''
+    return (
+        (ay * bz) - (az * by),
+        (az * bx) - (ax * bz),
+        (ax * by) - (ay * bx)
+    )
+
+@njit(cache=True, fastmath=True)
+def dist3(ax: float, ay: float, az: float, bx: float, by: float, bz: float) -> float:
+    '''
+    Returns the distance between the positions (ax, ay, az) and (bx, by, bz)
+    '''
+    dx = ax - bx
+    dy = ay - by
+    dz = az - bz
+    return math.sqrt((dx * dx) + (dy * dy) + (dz * dz))